@@ -1,35 +1,87 @@
 import requests
 from datetime import datetime, timezone
 from flask import Flask, request, jsonify
+from flask_compress import Compress
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 import os
+import logging
 from http import HTTPStatus
 from helpers.git_releases import GitHubReleases
+from helpers.json_provider import ORJSONProvider
 import helpers.common as Common
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+# Reject oversized bodies before Werkzeug parses them
+app.config["MAX_CONTENT_LENGTH"] = 512 * 1024
+
+# Gzip responses larger than 1 KB (mostly check_updates changelogs)
+app.config["COMPRESS_ALGORITHM"] = "gzip"
+app.config["COMPRESS_MIN_SIZE"] = 1024
+app.config["COMPRESS_LEVEL"] = 5
+Compress(app)
 
 MAIN_UPDATE_ARCHIVE = "update.tar.gz"
 LB_INSTALL_ARCHIVE = "loadbalancer.tar.gz"
 LB_UPDATE_ARCHIVE = "loadbalancer_update.tar.gz"
 
-# Rate limiting setup
+# Status codes resolved once instead of on every response
+HTTP_OK = HTTPStatus.OK.value
+HTTP_BAD_REQUEST = HTTPStatus.BAD_REQUEST.value
+HTTP_REQUEST_ENTITY_TOO_LARGE = HTTPStatus.REQUEST_ENTITY_TOO_LARGE.value
+HTTP_INTERNAL_SERVER_ERROR = HTTPStatus.INTERNAL_SERVER_ERROR.value
+
+
+def error_body(message: str) -> str:
+    """Serialize an error payload once so handlers can reuse it"""
+    return app.json.dumps({"status": "error", "message": message})
+
+
+# Static error bodies, serialized once at import
+ERR_VERSION_REQUIRED = error_body("Version parameter is required")
+ERR_FILE_TYPE_REQUIRED = error_body("File type parameter is required")
+ERR_INVALID_VERSION = error_body("Invalid version format")
+ERR_INVALID_FILE_TYPE = error_body("File type parameter is not valide")
+ERR_UPDATES_NOT_FOUND = error_body("Updates not found")
+ERR_BODY_TOO_LARGE = error_body("Request body too large")
+
+
+def error_response(body: str, status: int):
+    """Build a JSON response from a pre-serialized body"""
+    return app.response_class(body, status=status, mimetype="application/json")
+
+
+# Rate limiting setup (storage backend is attached at startup)
 limiter = Limiter(
-    app=app, key_func=get_remote_address, default_limits=["200 per day", "50 per hour"]
+    key_func=get_remote_address, default_limits=["200 per day", "50 per hour"]
 )
 
 
+# Early exit for oversized requests based on Content-Length
+@app.before_request
+def reject_oversized_requests():
+    if (
+        request.content_length
+        and request.content_length > app.config["MAX_CONTENT_LENGTH"]
+    ):
+        return error_response(ERR_BODY_TOO_LARGE, HTTP_REQUEST_ENTITY_TOO_LARGE)
+
+
+# Security headers applied to every response
+SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Content-Security-Policy": "default-src 'self'",
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+}
+
+
 # Security headers middleware
 @app.after_request
 def add_security_headers(response):
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Content-Security-Policy"] = "default-src 'self'"
-    response.headers["Strict-Transport-Security"] = (
-        "max-age=31536000; includeSubDomains"
-    )
+    response.headers.update(SECURITY_HEADERS)
     return response
 
 
@@ -40,41 +92,28 @@ def check_updates():
     try:
         version = request.args.get("version")
         if not version:
-            return (
-                jsonify(
-                    {"status": "error", "message": "Version parameter is required"}
-                ),
-                HTTPStatus.BAD_REQUEST,
-            )
+            return error_response(ERR_VERSION_REQUIRED, HTTP_BAD_REQUEST)
 
         # Sanitize input
         version = version.strip()
         if not repo.is_valid_version(version):
-            return (
-                jsonify({"status": "error", "message": "Invalid version format"}),
-                HTTPStatus.BAD_REQUEST,
-            )
+            return error_response(ERR_INVALID_VERSION, HTTP_BAD_REQUEST)
 
         next_version = repo.get_next_version(version)
-        changelog = repo.get_changelog(
-            f"https://raw.githubusercontent.com/{config["git_owner"]}/{config["git_repo"]}_Update/refs/heads/main/changelog.json"
-        )
-        url = f"https://github.com/{config["git_owner"]}/{config["git_repo"]}/releases/tag/{next_version}"
+        changelog = repo.get_changelog(CHANGELOG_URL)
+        url = RELEASE_PAGE_URL(version=next_version)
 
         if not next_version:
-            return (
-                jsonify({"status": "error", "message": "Updates not found"}),
-                HTTPStatus.BAD_REQUEST,
-            )
+            return error_response(ERR_UPDATES_NOT_FOUND, HTTP_BAD_REQUEST)
 
         return (
             jsonify({"version": next_version, "changelog": changelog, "url": url}),
-            HTTPStatus.OK,
+            HTTP_OK,
         )
     except ValueError as ve:
         return (
             jsonify({"status": "error", "message": f"Invalid version: {str(ve)}"}),
-            HTTPStatus.BAD_REQUEST,
+            HTTP_BAD_REQUEST,
         )
     except Exception as e:
         return (
@@ -85,7 +124,7 @@ def check_updates():
                     "error_type": type(e).__name__,
                 }
             ),
-            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTP_INTERNAL_SERVER_ERROR,
         )
 
 
@@ -98,28 +137,15 @@ def get_update():
         file_type = request.args.get("file_type")
 
         if not version:
-            return (
-                jsonify(
-                    {"status": "error", "message": "Version parameter is required"}
-                ),
-                HTTPStatus.BAD_REQUEST,
-            )
+            return error_response(ERR_VERSION_REQUIRED, HTTP_BAD_REQUEST)
 
         if not file_type:
-            return (
-                jsonify(
-                    {"status": "error", "message": "File type parameter is required"}
-                ),
-                HTTPStatus.BAD_REQUEST,
-            )
+            return error_response(ERR_FILE_TYPE_REQUIRED, HTTP_BAD_REQUEST)
 
         # Sanitize input
         version = version.strip()
         if not repo.is_valid_version(version):
-            return (
-                jsonify({"status": "error", "message": "Invalid version format"}),
-                HTTPStatus.BAD_REQUEST,
-            )
+            return error_response(ERR_INVALID_VERSION, HTTP_BAD_REQUEST)
 
         match file_type:
             case "main":
@@ -129,25 +155,14 @@ def get_update():
             case "lb_update":
                 update_file = LB_UPDATE_ARCHIVE
             case _:
-                return (
-                    jsonify(
-                        {
-                            "status": "error",
-                            "message": "File type parameter is not valide",
-                        }
-                    ),
-                    HTTPStatus.BAD_REQUEST,
-                )
+                return error_response(ERR_INVALID_FILE_TYPE, HTTP_BAD_REQUEST)
 
         next_version = repo.get_next_version(version)
-        upd_archive_url = f"https://github.com/{config["git_owner"]}/{config["git_repo"]}/releases/download/{next_version}/{update_file}"
+        upd_archive_url = RELEASE_DOWNLOAD_URL(version=next_version, file=update_file)
         hash_md5 = repo.get_asset_hash(next_version, update_file)
 
         if not next_version:
-            return (
-                jsonify({"status": "error", "message": "Updates not found"}),
-                HTTPStatus.BAD_REQUEST,
-            )
+            return error_response(ERR_UPDATES_NOT_FOUND, HTTP_BAD_REQUEST)
 
         return (
             jsonify(
@@ -156,13 +171,13 @@ def get_update():
                     "md5": hash_md5,
                 }
             ),
-            HTTPStatus.OK,
+            HTTP_OK,
         )
 
     except ValueError as ve:
         return (
             jsonify({"status": "error", "message": f"Invalid version: {str(ve)}"}),
-            HTTPStatus.BAD_REQUEST,
+            HTTP_BAD_REQUEST,
         )
     except Exception as e:
         return (
@@ -173,17 +188,22 @@ def get_update():
                     "error_type": type(e).__name__,
                 }
             ),
-            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTP_INTERNAL_SERVER_ERROR,
         )
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     DEFAULT_CONFIG = {
         "host": "0.0.0.0",
         "port": 8080,
         "debug": False,
         "git_owner": "Vateron-Media",
         "git_repo": "XC_VM",
+        "ratelimit_storage_uri": "memory://",
+        # Unauthenticated clients get 60 API requests per hour per IP, shared by workers
+        "refresh_interval": 1800,
     }
 
     # Load configuration
@@ -199,7 +219,18 @@ if __name__ == "__main__":
     if missing_keys:
         raise ValueError(f"Missing required configuration: {', '.join(missing_keys)}")
 
+    # Shared storage (e.g. redis://127.0.0.1:6379/0) keeps limits exact across workers
+    app.config["RATELIMIT_STORAGE_URI"] = config["ratelimit_storage_uri"]
+    limiter.init_app(app)
+
     repo = GitHubReleases(config["git_owner"], config["git_repo"])
+    # Values from config.ini (and overrides typed after them) arrive as strings
+    refresh_interval = float(config["refresh_interval"])
+
+    # URLs built once at startup instead of on every request
+    CHANGELOG_URL = f"https://raw.githubusercontent.com/{config['git_owner']}/{config['git_repo']}_Update/refs/heads/main/changelog.json"
+    RELEASE_PAGE_URL = f"https://github.com/{config['git_owner']}/{config['git_repo']}/releases/tag/{{version}}".format
+    RELEASE_DOWNLOAD_URL = f"https://github.com/{config['git_owner']}/{config['git_repo']}/releases/download/{{version}}/{{file}}".format
 
     # Run with gunicorn in production
     if not config["debug"]:
@@ -212,12 +243,19 @@ if __name__ == "__main__":
 
             def load_config(self):
                 self.cfg.set("bind", f"{config['host']}:{config['port']}")
-                self.cfg.set("workers", 4)
+                # Threaded workers keep serving while others wait on GitHub
+                self.cfg.set("worker_class", "gthread")
+                self.cfg.set("workers", 2)
+                self.cfg.set("threads", 16)
                 self.cfg.set("timeout", 30)
+                self.cfg.set("keepalive", 30)
 
             def load(self):
+                # Runs in each worker after fork, so the refresh thread lives there
+                repo.start_auto_refresh(refresh_interval)
                 return self.application
 
         FlaskApplication(app).run()
     else:
+        repo.start_auto_refresh(refresh_interval)
         app.run(host=config["host"], port=config["port"], debug=config["debug"])
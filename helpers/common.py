@@ -1,9 +1,11 @@
 import argparse
 import json
 import os
+import sys
 import configparser
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
 
 def load_config(
@@ -20,7 +22,28 @@ def load_config(
     :param env_prefix: Префикс для переменных окружения
     :return: Объединенный словарь конфигурации
     """
-    config = default_config.copy()
+    # Результат кэшируется, поэтому возвращаем копию
+    return dict(
+        _load_config_cached(tuple(default_config.items()), config_file_path, env_prefix)
+    )
+
+
+def _is_gunicorn() -> bool:
+    """
+    Проверяет, запущен ли процесс под gunicorn (sys.argv принадлежит gunicorn)
+    """
+    if "gunicorn" in os.path.basename(sys.argv[0]):
+        return True
+    return os.environ.get("SERVER_SOFTWARE", "").startswith("gunicorn")
+
+
+@lru_cache(maxsize=None)
+def _load_config_cached(
+    default_items: Tuple[Tuple[str, Any], ...],
+    config_file_path: Optional[str],
+    env_prefix: str,
+) -> Dict[str, Any]:
+    config = dict(default_items)
 
     # 1. Загрузка из файла конфигурации
     if config_file_path:
@@ -30,8 +53,8 @@ def load_config(
                     file_config = json.load(f)
                 config.update(file_config)
             elif config_file_path.endswith(".ini"):
-                parser = configparser.ConfigParser()
-                parser.read(config_file_path)
+                parser = configparser.ConfigParser(interpolation=None)
+                parser.read(config_file_path, encoding="utf-8")
                 file_config = {
                     k: v
                     for section in parser.sections()
@@ -58,6 +81,10 @@ def load_config(
                 config[key] = value
 
     # 3. Загрузка из аргументов командной строки
+    # Под gunicorn sys.argv содержит его собственные флаги — пропускаем argparse
+    if _is_gunicorn():
+        return config
+
     parser = argparse.ArgumentParser()
     for key, value in config.items():
         arg_name = f"--{key.replace('_', '-')}"
@@ -1,15 +1,139 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import json
 import re
-from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, List, NamedTuple, Optional, Dict, Tuple
 import logging
+import threading
 import time
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Logging configuration
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import
+# Release version X.Y.Z with non-negative parts and no leading zeros
+_VERSION_RE = re.compile(r"(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)")
+# Bound once so _matches_version skips the attribute lookup on every call
+_version_fullmatch = _VERSION_RE.fullmatch
+
+# Release asset listing MD5 hashes of the other assets
+_HASH_FILE_NAME = "hashes.md5"
+# Maximum number of hash files downloaded concurrently
+_HASH_FETCH_WORKERS = 8
+# Keep-alive connections kept per host. Sized for the API's request threads plus
+# the hash-file fan-out, so connections go back to the pool instead of being
+# discarded and re-handshaked under load
+_POOL_MAXSIZE = 32
+# Hosts the session talks to: api.github.com, github.com,
+# objects.githubusercontent.com and raw.githubusercontent.com
+_POOL_CONNECTIONS = 4
+# Upper bound on the hash file size; a few lines of "<md5> <file name>"
+_HASH_FILE_MAX_SIZE = 4096
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# Log messages for failed changelog requests, by HTTP status code
+_CHANGELOG_STATUS_MSGS = {
+    404: "Changelog file not found (404)",
+    403: "Access forbidden (403) - Check API rate limits or permissions",
+    500: "Server error (500) while fetching changelog",
+}
+
+
+@lru_cache(maxsize=512)
+def _matches_version(version: str) -> bool:
+    """
+    Check whether a string matches the X.Y.Z release version pattern.
+
+    Args:
+        version (str): The version string to check.
+
+    Returns:
+        bool: True if it matches, False otherwise.
+    """
+    return _version_fullmatch(version) is not None
+
+
+class _ReleaseIndex(NamedTuple):
+    """Cached release data, built once per release list and never modified."""
+
+    # Tags in GitHub order (latest first)
+    tag_order: Tuple[str, ...]
+    # Position of each tag in tag_order
+    tag_index: Dict[str, int]
+    # Download URLs of each release's assets: {tag: {asset_name: url}}
+    releases_by_tag: Dict[str, Dict[str, str]]
+
+
+_EMPTY_INDEX = _ReleaseIndex(tag_order=(), tag_index={}, releases_by_tag={})
+
+
+def _is_md5(value: str) -> bool:
+    """
+    Check whether a string is a 32-character hexadecimal MD5 hash.
+
+    Args:
+        value (str): The string to check.
+
+    Returns:
+        bool: True if valid, False otherwise.
+    """
+    return len(value) == 32 and _HEX_DIGITS.issuperset(value)
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """
+    Parse a JSON response body with orjson when available.
+
+    Args:
+        response (requests.Response): The response to parse.
+
+    Returns:
+        Any: The parsed JSON.
+
+    Raises:
+        requests.exceptions.InvalidJSONError: If the body is not valid JSON.
+    """
+    try:
+        return _json_loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(
+            f"Invalid JSON in response from {response.url}: {e}", response=response
+        ) from e
+
 
 class GitHubReleases:
+    __slots__ = (
+        "owner",
+        "repo",
+        "api_url",
+        "headers",
+        "timeout",
+        "_cache_timestamp",
+        "_cache_ttl",
+        "_cache_soft_ttl",
+        "_refresh_lock",
+        "_refreshing",
+        "_etag",
+        "_last_modified",
+        "_changelog_url",
+        "_changelog_cache",
+        "_changelog_etag",
+        "_changelog_timestamp",
+        "_changelog_lock",
+        "_index",
+        "_session",
+    )
+
     def __init__(self, owner: str, repo: str, token: Optional[str] = None):
         """
         Initialize a GitHubReleases instance for accessing release data of a GitHub repository.
@@ -27,9 +151,62 @@ class GitHubReleases:
         self.api_url = f"https://api.github.com/repos/{owner}/{repo}/releases"
         self.headers = {"Authorization": f"token {token}"} if token else {}
         self.timeout = 5  # Request timeout in seconds
-        self._cache: Optional[Dict] = None  # Cache for release data
         self._cache_timestamp: Optional[float] = None  # Timestamp of last cache update
         self._cache_ttl: float = 1800  # Cache TTL in seconds (30 minutes)
+        # Past this age the cache is still served but refreshed in the background
+        self._cache_soft_ttl: float = 1500  # Soft TTL in seconds (25 minutes)
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False  # Whether a background refresh is in flight
+        # Validators of the cached release list for conditional requests
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        # Changelog already filtered against the release list, with its URL and ETag
+        self._changelog_url: Optional[str] = None
+        self._changelog_cache: Optional[List[Dict]] = None
+        self._changelog_etag: Optional[str] = None
+        self._changelog_timestamp: Optional[float] = None
+        # Held while swapping the release index or writing the changelog cache, so a
+        # changelog filtered against one index is never stored alongside another
+        self._changelog_lock = threading.Lock()
+        # Release data is cached only as this index, rebuilt whenever it changes and
+        # swapped in one assignment, so readers never see a half-updated one
+        self._index: _ReleaseIndex = _EMPTY_INDEX
+
+        # Shared session so keep-alive connections are reused between calls. Auth is
+        # sent per request to GitHub only, never to the caller's changelog URL
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=_POOL_CONNECTIONS,
+                pool_maxsize=_POOL_MAXSIZE,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    # Hand back the last response so callers see the real status
+                    raise_on_status=False,
+                    # Never park a request thread on a server-chosen Retry-After
+                    respect_retry_after_header=False,
+                ),
+            ),
+        )
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release its pooled connections.
+
+        Example:
+            >>> repo = GitHubReleases("Vateron-Media", "XC_VM")
+            >>> repo.close()
+        """
+        self._session.close()
+
+    def __enter__(self) -> "GitHubReleases":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def clear_cache(self) -> None:
         """
@@ -39,9 +216,13 @@ class GitHubReleases:
             >>> repo = GitHubReleases("Vateron-Media", "XC_VM")
             >>> repo.clear_cache()
         """
-        self._cache = None
         self._cache_timestamp = None
-        logger.info(f"Cache cleared for {self.owner}/{self.repo}")
+        self._etag = None
+        self._last_modified = None
+        with self._changelog_lock:
+            self._index = _EMPTY_INDEX
+            self._clear_changelog_cache()
+        logger.info("Cache cleared for %s/%s", self.owner, self.repo)
 
     def _is_cache_valid(self) -> bool:
         """
@@ -50,10 +231,190 @@ class GitHubReleases:
         Returns:
             bool: True if cache is valid, False otherwise.
         """
-        if self._cache is None or self._cache_timestamp is None:
+        if self._cache_timestamp is None:
             return False
         return (time.time() - self._cache_timestamp) < self._cache_ttl
 
+    def _is_cache_stale(self) -> bool:
+        """
+        Check if the cache is older than the soft TTL and should be revalidated.
+
+        Returns:
+            bool: True if cache is stale, False otherwise.
+        """
+        if self._cache_timestamp is None:
+            return True
+        return (time.time() - self._cache_timestamp) >= self._cache_soft_ttl
+
+    def _refresh_in_background(self) -> None:
+        """
+        Start revalidating the release list on a daemon thread, unless a refresh is
+        already in flight, so the caller can keep serving the stale cache.
+        """
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def background_refresh() -> None:
+            try:
+                self._fetch_releases()
+            except requests.exceptions.RequestException as e:
+                logger.error("Background refresh failed: %s", e)
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=background_refresh, daemon=True).start()
+
+    def _clear_changelog_cache(self) -> None:
+        """
+        Drop the cached changelog, which is only valid for the release list it was
+        filtered against.
+        """
+        self._changelog_url = None
+        self._changelog_cache = None
+        self._changelog_etag = None
+        self._changelog_timestamp = None
+
+    def _ensure_cache(self) -> None:
+        """
+        Make sure the release cache can be used: fetch it synchronously when it is
+        missing or past the TTL, and revalidate it in the background when it is past
+        the soft TTL.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
+        if self._is_cache_valid():
+            if self._is_cache_stale():
+                self._refresh_in_background()
+            return
+
+        try:
+            self._fetch_releases()
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to fetch releases: %s", e)
+            raise
+        logger.info(
+            "Retrieved and cached %d releases from %s/%s",
+            len(self._index.tag_order),
+            self.owner,
+            self.repo,
+        )
+
+    def _fetch_releases(self) -> None:
+        """
+        Fetch the release list into the cache, revalidating it with the stored ETag.
+
+        When GitHub answers 304 Not Modified, only the cache timestamp is renewed:
+        no body is downloaded, parsed or re-indexed.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
+        headers = dict(self.headers)
+        if self._cache_timestamp is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
+        response = self._session.get(
+            self.api_url, headers=headers, timeout=self.timeout
+        )
+        if response.status_code == 304 and self._cache_timestamp is not None:
+            self._cache_timestamp = time.time()
+            logger.info("Releases not modified for %s/%s", self.owner, self.repo)
+            return
+
+        response.raise_for_status()
+        self._rebuild_indices(_parse_json(response))
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+        self._cache_timestamp = time.time()
+
+    def _rebuild_indices(self, releases: List[Dict]) -> None:
+        """
+        Index release data by tag, keeping only the fields that lookups use
+        (tag names and asset download URLs) and discarding the raw JSON.
+
+        Args:
+            releases (List[Dict]): Release data returned by the GitHub API.
+        """
+        releases_by_tag = {}
+        for release in releases:
+            tag_name = release.get("tag_name")
+            if not tag_name:
+                continue
+            releases_by_tag[tag_name] = {
+                asset.get("name"): asset.get("browser_download_url")
+                for asset in release.get("assets", [])
+            }
+
+        tag_order = tuple(releases_by_tag)
+        index = _ReleaseIndex(
+            tag_order=tag_order,
+            tag_index={tag: i for i, tag in enumerate(tag_order)},
+            releases_by_tag=releases_by_tag,
+        )
+        # The changelog was filtered against the old index, so it goes with it
+        with self._changelog_lock:
+            self._index = index
+            self._clear_changelog_cache()
+
+    def refresh(self) -> None:
+        """
+        Revalidate the cached release data with GitHub, regardless of the cache TTL.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+
+        Example:
+            >>> repo = GitHubReleases("Vateron-Media", "XC_VM")
+            >>> repo.refresh()
+        """
+        self._fetch_releases()
+        logger.info("Refreshed cache for %s/%s", self.owner, self.repo)
+
+    def start_auto_refresh(self, interval: float = 1800) -> threading.Thread:
+        """
+        Start a daemon thread that refreshes the release cache periodically, so that
+        lookups are served from memory instead of waiting on GitHub.
+
+        Args:
+            interval (float): Seconds between refreshes (default: 1800). Every worker
+                polls on its own, so keep this well within GitHub's API rate limit.
+
+        Returns:
+            threading.Thread: The started background thread.
+
+        Raises:
+            ValueError: If the interval is not a positive number.
+
+        Example:
+            >>> repo = GitHubReleases("Vateron-Media", "XC_VM")
+            >>> repo.start_auto_refresh(1800)
+        """
+        # Validated here, since a bad value would otherwise kill the thread at sleep()
+        interval = float(interval)
+        if not interval > 0:
+            raise ValueError("Refresh interval must be a positive number of seconds")
+
+        def refresh_loop() -> None:
+            while True:
+                try:
+                    self.refresh()
+                except Exception as e:
+                    # Keep the thread alive on bad responses as well as network errors
+                    logger.error("Background refresh failed: %s", e)
+                time.sleep(interval)
+
+        thread = threading.Thread(
+            target=refresh_loop, name=f"refresh-{self.owner}/{self.repo}", daemon=True
+        )
+        thread.start()
+        return thread
+
     def get_releases(self) -> List[str]:
         """
         Fetch all release versions (tags) from the GitHub repository, using cache if valid.
@@ -69,34 +430,8 @@ class GitHubReleases:
             >>> repo.get_releases()
             ['1.0.2', '1.0.1', '1.0.0']
         """
-        if self._is_cache_valid():
-            logger.info(f"Using cached releases for {self.owner}/{self.repo}")
-            releases = [
-                release.get("tag_name", "")
-                for release in self._cache
-                if release.get("tag_name")
-            ]
-            return releases
-
-        try:
-            response = requests.get(
-                self.api_url, headers=self.headers, timeout=self.timeout
-            )
-            response.raise_for_status()
-            self._cache = response.json()
-            self._cache_timestamp = time.time()
-            releases = [
-                release.get("tag_name", "")
-                for release in self._cache
-                if release.get("tag_name")
-            ]
-            logger.info(
-                f"Retrieved and cached {len(releases)} releases from {self.owner}/{self.repo}"
-            )
-            return releases
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to fetch releases: {e}")
-            raise
+        self._ensure_cache()
+        return list(self._index.tag_order)
 
     def get_next_version(self, current_version: str) -> Optional[str]:
         """
@@ -113,20 +448,20 @@ class GitHubReleases:
             >>> repo.get_next_version("1.0.0")
             '1.0.1'
         """
-        releases = self.get_releases()
-        if current_version not in releases:
-            logger.warning(f"Version {current_version} not found in releases")
+        self._ensure_cache()
+        index = self._index  # Read once, a refresh may swap it meanwhile
+        position = index.tag_index.get(current_version)
+        if position is None:
+            logger.warning("Version %s not found in releases", current_version)
             return None
-        index = releases.index(current_version)
-        return releases[index - 1] if index > 0 else None
+        return index.tag_order[position - 1] if position > 0 else None
 
     def get_asset_hash(self, version: str, asset_name: str) -> Optional[str]:
         """
-        Retrieve the MD5 hash of a release asset from its corresponding hash file.
+        Retrieve the MD5 hash of a release asset from the release's hash file.
 
-        This method looks for a plain text file named with the asset file name plus a suffix
-        (e.g., "update.tar.gz.md5" for "update.tar.gz"). The hash file must contain a single line
-        with a valid 32-character MD5 hash.
+        The release must include a plain text "hashes.md5" asset where each line holds an
+        MD5 hash followed by the asset file name (e.g., "d41d8... update.tar.gz").
 
         Args:
             version (str): The release tag (e.g., "1.0.0").
@@ -135,73 +470,140 @@ class GitHubReleases:
         Returns:
             Optional[str]: The MD5 hash string, or None if not found or invalid.
 
-        Raises:
-            requests.exceptions.RequestException: If the request fails.
-
         Example:
             >>> repo = GitHubReleases("Vateron-Media", "XC_VM")
             >>> repo.get_asset_hash("1.0.0", "update.tar.gz")
             'd41d8cd98f00b204e9800998ecf8427e'
         """
+        return self.get_asset_hashes([(version, asset_name)])[(version, asset_name)]
+
+    def get_asset_hashes(
+        self, pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Optional[str]]:
+        """
+        Retrieve the MD5 hashes of several release assets at once.
+
+        Each release's hash file is downloaded only once, and hash files of different
+        releases are downloaded concurrently over the shared session.
+
+        Args:
+            pairs (List[Tuple[str, str]]): (release tag, asset file name) pairs.
+
+        Returns:
+            Dict[Tuple[str, str], Optional[str]]: The MD5 hash for each pair, or None if
+            not found or invalid.
+
+        Example:
+            >>> repo = GitHubReleases("Vateron-Media", "XC_VM")
+            >>> repo.get_asset_hashes([("1.0.0", "update.tar.gz"), ("1.0.1", "update.tar.gz")])
+            {('1.0.0', 'update.tar.gz'): 'd41d8...', ('1.0.1', 'update.tar.gz'): '0cc17...'}
+        """
+        results: Dict[Tuple[str, str], Optional[str]] = {pair: None for pair in pairs}
         try:
-            # Use cached data if valid
-            if not self._is_cache_valid():
-                response = requests.get(
-                    self.api_url, headers=self.headers, timeout=self.timeout
+            self._ensure_cache()
+        except requests.exceptions.RequestException:
+            return results
+
+        # Locate the hash file of every requested release
+        releases_by_tag = self._index.releases_by_tag
+        hash_file_urls = {}
+        for version in {version for version, _ in pairs}:
+            assets = releases_by_tag.get(version)
+            if assets is None:
+                logger.warning("Version %s not found", version)
+                continue
+            hash_file_url = assets.get(_HASH_FILE_NAME)
+            if hash_file_url is None:
+                logger.warning(
+                    "Hash file %s not found for version %s", _HASH_FILE_NAME, version
                 )
-                response.raise_for_status()
-                self._cache = response.json()
-                self._cache_timestamp = time.time()
-                logger.info(f"Updated cache for {self.owner}/{self.repo}")
-            releases = self._cache
-
-            for release in releases:
-                if release.get("tag_name") == version:
-                    assets = release.get("assets", [])
-                    hash_file_name = "hashes.md5"
-
-                    for asset in assets:
-                        if asset.get("name") == hash_file_name:
-                            hash_response = requests.get(
-                                asset.get("browser_download_url"),
-                                headers=self.headers,
-                                timeout=self.timeout,
-                            )
-                            hash_response.raise_for_status()
-                            hash_text = hash_response.text.strip()
-
-                            for line in hash_text.splitlines():
-                                line = line.strip()
-                                if not line:  # Пропускаем пустые строки
-                                    continue
-                                parts = line.split(
-                                    maxsplit=1
-                                )  # Делим только по первому пробелу
-
-                                if len(parts) == 2:
-                                    if parts[1] == asset_name:
-                                        logger.info(
-                                            f"Retrieved MD5 hash for {asset_name} in version {version}"
-                                        )
-                                        return parts[0]
-                                else:
-                                    logger.warning(
-                                        f"Invalid MD5 hash format in {hash_file_name} for version {version}"
-                                    )
-                                    return None
-
-                    logger.warning(
-                        f"Hash file {hash_file_name} not found for version {version}"
+                continue
+            hash_file_urls[version] = hash_file_url
+
+        # Download hash files, concurrently when more than one release is involved
+        if len(hash_file_urls) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(_HASH_FETCH_WORKERS, len(hash_file_urls))
+            ) as executor:
+                hash_files = dict(
+                    zip(
+                        hash_file_urls,
+                        executor.map(self._fetch_hash_file, hash_file_urls.values()),
                     )
-                    return None
+                )
+        else:
+            hash_files = {
+                version: self._fetch_hash_file(url)
+                for version, url in hash_file_urls.items()
+            }
+
+        for version, asset_name in pairs:
+            hashes = hash_files.get(version)
+            if hashes is None:
+                continue
+            hash_md5 = hashes.get(asset_name)
+            if hash_md5 is None:
+                logger.warning("No MD5 hash for %s in version %s", asset_name, version)
+            elif not _is_md5(hash_md5):
+                logger.warning(
+                    "Invalid MD5 hash for %s in version %s", asset_name, version
+                )
+            else:
+                logger.info(
+                    "Retrieved MD5 hash for %s in version %s", asset_name, version
+                )
+                results[(version, asset_name)] = hash_md5
+        return results
 
-            logger.warning(f"Version {version} not found")
-            return None
+    def _fetch_hash_file(self, url: str) -> Optional[Dict[str, str]]:
+        """
+        Download and parse a hash file into a mapping of asset file name to MD5 hash.
 
+        Args:
+            url (str): Download URL of the hash file.
+
+        Returns:
+            Optional[Dict[str, str]]: Hashes by asset name, or None if the download
+            failed, the file is larger than expected, or it is malformed.
+        """
+        try:
+            # Stream so a misnamed large asset is never downloaded in full
+            with self._session.get(
+                url, headers=self.headers, timeout=self.timeout, stream=True
+            ) as response:
+                response.raise_for_status()
+                # A malformed length counts as unknown; the streamed cap still applies
+                content_length = response.headers.get("Content-Length", "").strip()
+                if (
+                    content_length.isascii()
+                    and content_length.isdigit()
+                    and int(content_length) > _HASH_FILE_MAX_SIZE
+                ):
+                    logger.warning("Hash file %s is too large", url)
+                    return None
+
+                content = b""
+                for chunk in response.iter_content(1024):
+                    content += chunk
+                    if len(content) > _HASH_FILE_MAX_SIZE:
+                        logger.warning("Hash file %s is too large", url)
+                        return None
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to fetch asset hash: {e}")
+            logger.error("Failed to fetch asset hash: %s", e)
             return None
 
+        hashes = {}
+        for line in content.decode("utf-8", errors="replace").splitlines():
+            line = line.strip()
+            if not line:  # Пропускаем пустые строки
+                continue
+            parts = line.split(maxsplit=1)  # Делим только по первому пробелу
+            if len(parts) != 2:
+                logger.warning("Invalid MD5 hash format in %s", url)
+                return None
+            hashes[parts[1]] = parts[0]
+        return hashes
+
     def get_changelog(self, changelog_file_url: str) -> Dict:
         """
         Retrieve the changelog for all releases from changelog.json files in JSON format.
@@ -227,53 +629,73 @@ class GitHubReleases:
                 {"version": "1.0.0", "changes": ["Initial release", "Added core features"]}
             ]
         """
+        response = None
         try:
-            # Use cached data if valid
-            if not self._is_cache_valid():
-                response = requests.get(
-                    self.api_url, headers=self.headers, timeout=self.timeout
-                )
-                response.raise_for_status()
-                self._cache = response.json()
-                self._cache_timestamp = time.time()
-                logger.info(f"Updated cache for {self.owner}/{self.repo}")
-            releases = self._cache
-
-            response = requests.get(changelog_file_url, timeout=self.timeout)
-            # Check status codes explicitly
-            if response.status_code == 200:
-                changelog = response.json()
-                # Get list of valid release versions
-                valid_versions = {release["tag_name"] for release in releases}
-                # Filter changelog to only include entries with matching release versions
-                filtered_changelog = [
-                    entry
-                    for entry in changelog
-                    if entry.get("version") in valid_versions
-                ]
-                logger.info(
-                    f"Successfully retrieved changelog with {len(filtered_changelog)} versions "
-                    f"after filtering (original: {len(changelog)} versions)"
-                )
-                return filtered_changelog
-            elif response.status_code == 404:
-                logger.error("Changelog file not found (404)")
-                return []
-            elif response.status_code == 403:
-                logger.error(
-                    "Access forbidden (403) - Check API rate limits or permissions"
-                )
-                return []
-            elif response.status_code == 500:
-                logger.error("Server error (500) while fetching changelog")
-                return []
-            else:
-                logger.error(f"Unexpected HTTP status code: {response.status_code}")
+            self._ensure_cache()
+            # Work on a snapshot, since a release rebuild on another thread clears the cache
+            with self._changelog_lock:
+                index = self._index
+                cached_url = self._changelog_url
+                cached_changelog = self._changelog_cache
+                cached_etag = self._changelog_etag
+                cached_at = self._changelog_timestamp
+            releases_by_tag = index.releases_by_tag
+            cached = (
+                cached_changelog is not None
+                and cached_at is not None
+                and cached_url == changelog_file_url
+            )
+            if cached and (time.time() - cached_at) < self._cache_ttl:
+                return cached_changelog
+
+            # Revalidate the cached changelog; 304 carries no body to download or filter
+            request_headers = {}
+            if cached and cached_etag:
+                request_headers["If-None-Match"] = cached_etag
+            response = self._session.get(
+                changelog_file_url, headers=request_headers, timeout=self.timeout
+            )
+            if response.status_code == 304 and cached:
+                # Extend the cache only if it was not dropped by a release rebuild
+                with self._changelog_lock:
+                    if index is self._index:
+                        self._changelog_timestamp = time.time()
+                return cached_changelog
+            if response.status_code != 200:
+                message = _CHANGELOG_STATUS_MSGS.get(response.status_code)
+                if message:
+                    logger.error(message)
+                else:
+                    logger.error(
+                        "Unexpected HTTP status code: %s", response.status_code
+                    )
                 return []
 
+            # Filter changelog to only include entries with matching release versions
+            changelog = _parse_json(response)
+            filtered_changelog = [
+                entry for entry in changelog if entry.get("version") in releases_by_tag
+            ]
+            logger.info(
+                "Successfully retrieved changelog with %d versions "
+                "after filtering (original: %d versions)",
+                len(filtered_changelog),
+                len(changelog),
+            )
+            # Skip caching if the release list was replaced while downloading
+            with self._changelog_lock:
+                if index is self._index:
+                    self._changelog_url = changelog_file_url
+                    self._changelog_cache = filtered_changelog
+                    self._changelog_etag = response.headers.get("ETag")
+                    self._changelog_timestamp = time.time()
+            return filtered_changelog
+
         except requests.exceptions.RequestException as e:
             logger.error(
-                f"Failed to fetch changelog: {e} (Status code: {response.status_code if 'response' in locals() else 'N/A'})"
+                "Failed to fetch changelog: %s (Status code: %s)",
+                e,
+                response.status_code if response is not None else "N/A",
             )
             return []
 
@@ -282,6 +704,9 @@ class GitHubReleases:
         """
         Validate whether a version string follows the format X.Y.Z.
 
+        The pattern match is memoized, since the same version strings are checked
+        repeatedly; the type and length checks run on every call.
+
         Args:
             version (str): The version string to validate (e.g., "1.0.0").
 
@@ -307,34 +732,10 @@ class GitHubReleases:
             logger.error("Version string too long")
             raise ValueError("Version string is too long")
 
-        pattern = r"^[0-9]+\.[0-9]+\.[0-9]+$"
-        if not re.match(pattern, version):
-            logger.warning(f"Invalid version format: {version}")
-            return False
-
-        try:
-            parts = version.split(".")
-            if len(parts) != 3:
-                logger.warning(f"Version must have three parts: {version}")
-                return False
-
-            for part in parts:
-                num = int(part)
-                if num < 0:
-                    logger.warning(
-                        f"Negative numbers are not allowed in version: {version}"
-                    )
-                    return False
-                if part.startswith("0") and len(part) > 1:
-                    logger.warning(
-                        f"Leading zeros are not allowed in version: {version}"
-                    )
-                    return False
-
-            return True
-        except ValueError as e:
-            logger.error(f"Error parsing version {version}: {e}")
+        if not _matches_version(version):
+            logger.warning("Invalid version format: %s", version)
             return False
+        return True
 
 
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+from typing import Any, Union
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that serializes with orjson, falling back to the standard
+    json module when orjson is not installed.
+
+    Example:
+        >>> app = Flask(__name__)
+        >>> app.json = ORJSONProvider(app)
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as a JSON string.
+
+        Args:
+            obj (Any): The data to serialize.
+            **kwargs: json.dumps arguments; only "indent" is honoured by orjson.
+
+        Returns:
+            str: The serialized JSON.
+        """
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """
+        Deserialize data from a JSON string or bytes.
+
+        Args:
+            s (Union[str, bytes]): The JSON document.
+            **kwargs: json.loads arguments, used only by the fallback.
+
+        Returns:
+            Any: The deserialized data.
+        """
+        if orjson is None:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)